@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+"""Compare attrs.csv/params.csv against the Gurobi reference manual and
+print CSV rows for any parameters or attributes we haven't implemented yet.
+The output rows can be pasted straight into the CSV files."""
+import asyncio
+
+from utils import (
+    BUILD_DIR,
+    fetch_attribute_data,
+    fetch_attribute_list,
+    fetch_parameter_data,
+    fetch_parameter_list,
+    http_session,
+    read_csv_column,
+)
+
+# Scraped "Type:" field -> dtype column value.  Anything else is `custom`.
+DTYPES = {
+    "double": "dbl",
+    "int": "int",
+    "string": "str",
+    "char": "chr",
+}
+
+# Scraped "Up:" section -> otype column value.  Anything else needs to be
+# filled in by hand.
+OTYPES = {
+    "Model Attributes": "model",
+    "Variable Attributes": "var",
+    "Linear Constraint Attributes": "constr",
+    "Quadratic Constraint Attributes": "qconstr",
+    "SOS Attributes": "sos",
+}
+
+
+# One row builder per kind; f-strings skip the per-row format-spec parsing
+# that str.format_map does.
+ROW_BUILDERS = {
+    "attribute": lambda d: f"{d['name']},{d['dtype']},{d['otype']}",
+    "parameter": lambda d: f"{d['name']},{d['dtype']}",
+}
+
+
+def print_missing(kind: str, rows):
+    if not rows:
+        return
+    build_row = ROW_BUILDERS[kind]
+    print(f"missing {kind}s:")
+    for row in rows:
+        print(build_row(row))
+
+
+def _attr_row(data: dict) -> dict:
+    return {
+        "name": data["name"],
+        "dtype": DTYPES.get(data.get("dtype", "").lower(), "custom"),
+        "otype": OTYPES.get(data["section"], "?"),
+    }
+
+
+def _param_row(data: dict) -> dict:
+    return {
+        "name": data["name"],
+        "dtype": DTYPES.get(data.get("dtype", "").lower(), "custom"),
+    }
+
+
+async def main():
+    implemented_attrs = set(read_csv_column(BUILD_DIR / "attrs.csv", "attr"))
+    implemented_params = set(read_csv_column(BUILD_DIR / "params.csv", "param"))
+
+    async with http_session() as session:
+        attributes, parameters = await asyncio.gather(
+            fetch_attribute_list(session), fetch_parameter_list(session)
+        )
+        missing_attrs = sorted(set(attributes) - implemented_attrs)
+        missing_params = sorted(set(parameters) - implemented_params)
+        attr_data = await asyncio.gather(
+            *(fetch_attribute_data(session, a, attributes[a]) for a in missing_attrs)
+        )
+        param_data = await asyncio.gather(
+            *(fetch_parameter_data(session, p, parameters[p]) for p in missing_params)
+        )
+
+    print_missing("attribute", [_attr_row(d) for d in attr_data])
+    print_missing("parameter", [_param_row(d) for d in param_data])
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
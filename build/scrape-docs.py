@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+"""Scrape parameter and attribute documentation from the Gurobi reference
+manual for every entry in attrs.csv/params.csv.
+
+For each entry this produces two files under build/docs/: a Markdown body
+(the cleaned-up description) and a JSON metadata file (type, default,
+bounds, etc.).  Pages are cached on disk by `fetch_html`, so re-runs are
+cheap; delete build/html-cache to force a re-download.
+"""
+import asyncio
+import re
+import textwrap
+from typing import Dict
+
+import aiofiles
+import orjson
+
+from utils import (
+    BUILD_DIR,
+    fetch_attribute_data,
+    fetch_attribute_list,
+    fetch_parameter_data,
+    fetch_parameter_list,
+    http_session,
+    read_csv_column,
+)
+
+DOC_DIR = BUILD_DIR / "docs"
+MD_WORD_WRAP = 120
+
+# textwrap.wrap() builds a fresh TextWrapper per call; reuse one instance for
+# every paragraph instead.  Long tokens are Gurobi names or URLs which
+# shouldn't be split mid-word in Markdown anyway.
+_WRAPPER = textwrap.TextWrapper(
+    width=MD_WORD_WRAP, break_long_words=False, break_on_hyphens=False
+)
+
+
+class DocumentationFiles:
+    """Paths of the generated files for a single parameter or attribute."""
+
+    def __init__(self, name: str):
+        self.body = DOC_DIR / f"{name}.md"
+        self.meta = DOC_DIR / f"{name}.json"
+
+    def all_exist(self) -> bool:
+        return self.body.exists() and self.meta.exists()
+
+
+def _name_highlight_re(names: Dict[str, str]) -> "re.Pattern":
+    """Regex matching any parameter/attribute name, longest first."""
+    alternation = "|".join(map(re.escape, sorted(names, key=len, reverse=True)))
+    return re.compile(rf"\b(?:{alternation})\b")
+
+
+def _postprocess_doc_paragraph(highlight: "re.Pattern", s: str) -> str:
+    """Wrap any parameter/attribute name mentioned in a paragraph in
+    backticks so it renders as code in the Markdown body."""
+    return highlight.sub(lambda m: f"`{m[0]}`", s)
+
+
+async def create_body_file(highlight: "re.Pattern", files: DocumentationFiles, data: dict):
+    paragraphs = (
+        "\n".join(_WRAPPER.wrap(_postprocess_doc_paragraph(highlight, p)))
+        for p in data["doc"].split("\n\n")
+    )
+    async with aiofiles.open(files.body, "w") as fp:
+        await fp.write("\n\n".join(paragraphs))
+
+
+async def create_metadata_file(files: DocumentationFiles, data: dict):
+    meta = {k: v for k, v in data.items() if k != "doc"}
+    async with aiofiles.open(files.meta, "wb") as fp:
+        await fp.write(orjson.dumps(meta, option=orjson.OPT_INDENT_2))
+
+
+async def create_documentation(session, highlight, fetch_data, name, path, suffix):
+    files = DocumentationFiles(name + suffix)
+    data = await fetch_data(session, name, path)
+    await create_body_file(highlight, files, data)
+    await create_metadata_file(files, data)
+
+
+async def main():
+    attrs = read_csv_column(BUILD_DIR / "attrs.csv", "attr")
+    params = read_csv_column(BUILD_DIR / "params.csv", "param")
+    DOC_DIR.mkdir(exist_ok=True)
+
+    # Filter out entries whose files already exist before gathering, so a warm
+    # run doesn't schedule (and tear down) a no-op coroutine per entry.
+    todo_attrs = [a for a in attrs if not DocumentationFiles(a + "_attr").all_exist()]
+    todo_params = [p for p in params if not DocumentationFiles(p + "_param").all_exist()]
+    if not (todo_attrs or todo_params):
+        return
+
+    async with http_session() as session:
+        # The two index fetches and the two documentation batches are
+        # independent, so run each pair concurrently instead of serialising
+        # attributes before parameters.
+        attributes, parameters = await asyncio.gather(
+            fetch_attribute_list(session), fetch_parameter_list(session)
+        )
+        attr_highlight = _name_highlight_re(attributes)
+        param_highlight = _name_highlight_re(parameters)
+        await asyncio.gather(
+            *(
+                create_documentation(
+                    session, attr_highlight, fetch_attribute_data, a, attributes[a], "_attr"
+                )
+                for a in todo_attrs
+            ),
+            *(
+                create_documentation(
+                    session, param_highlight, fetch_parameter_data, p, parameters[p], "_param"
+                )
+                for p in todo_params
+            ),
+        )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
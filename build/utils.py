@@ -0,0 +1,224 @@
+"""Shared helpers for the documentation-scraping scripts in this directory."""
+import asyncio
+import csv
+import gzip
+import os
+import re
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Dict, List
+
+import aiohttp
+import lxml.html
+from bs4 import BeautifulSoup
+from lxml import etree
+
+BUILD_DIR = Path(__file__).parent
+CACHE_DIR = BUILD_DIR / "html-cache"
+# The cache-hit path in fetch_html runs once per page per run; plain string
+# paths keep it free of per-call PosixPath allocations.
+_CACHE_DIR_STR = str(CACHE_DIR)
+
+BASE_URL = "https://www.gurobi.com/documentation/9.1/refman"
+PARAMETER_INDEX = "parameters.html"
+ATTRIBUTE_INDEX = "attributes.html"
+
+# Boilerplate paragraphs which appear on every parameter/attribute page and
+# add nothing to the generated documentation.  The patterns are combined into
+# a single alternation so each paragraph is tested in one regex pass.
+_DOC_REMOVE_SRC = (
+    r"For examples of how to query or modify parameter values from our APIs, refer to our Parameter Examples\.",
+    r"For examples of how to query or modify attribute values from our APIs, refer to our Attribute Examples\.",
+    r"One of the Gurobi [a-z ]+ attributes\.",
+)
+_DOC_REMOVE_RE = re.compile("(?:" + "|".join(f"(?:{p})" for p in _DOC_REMOVE_SRC) + ")")
+
+# Labels of the metadata table rows on a parameter page.  Attribute pages only
+# have the first and last.
+PARAMETER_FIELDS = (
+    ("dtype", "Type:"),
+    ("default", "Default value:"),
+    ("min", "Minimum value:"),
+    ("max", "Maximum value:"),
+    ("modifiable", "Modifiable:"),
+)
+ATTRIBUTE_FIELDS = (
+    ("dtype", "Type:"),
+    ("modifiable", "Modifiable:"),
+)
+
+# XPath expressions are compiled once here; each evaluation is then a single
+# C-level pass over the tree instead of repeated find/sibling walks.
+_FIELD_XPATHS = {
+    label: etree.XPath(
+        f"//table//td[normalize-space()='{label}']/following-sibling::td[1]"
+    )
+    for _, label in PARAMETER_FIELDS
+}
+_XPATH_UP_LINK = etree.XPath(
+    "//div[@class='navigation']//b[contains(., 'Up:')]/following-sibling::a[1]"
+)
+_XPATH_DESCRIPTION = etree.XPath("//table[1]/following-sibling::p")
+_XPATH_IMAGES = etree.XPath("//img")
+
+
+def http_session() -> aiohttp.ClientSession:
+    """Create the HTTP session used by the scraping scripts.
+
+    All requests go to the one host, so the connector is tuned to keep
+    connections alive and reuse them rather than re-doing TLS + DNS on
+    every burst of cache misses."""
+    connector = aiohttp.TCPConnector(
+        limit=20,
+        limit_per_host=20,
+        ttl_dns_cache=600,
+        keepalive_timeout=75,
+        enable_cleanup_closed=True,
+    )
+    return aiohttp.ClientSession(connector=connector)
+
+
+# The scripts gather() a coroutine per page; this caps the in-flight requests
+# at the connector's connection limit so a cold cache doesn't fire hundreds of
+# requests at once.
+_FETCH_SEM = asyncio.Semaphore(20)
+
+
+async def fetch_html(session: aiohttp.ClientSession, path: str) -> bytes:
+    """Fetch `path` (relative to the reference manual root), caching the raw
+    HTML on disk so warm runs never touch the network.
+
+    Returns undecoded bytes; the HTML parsers detect the charset and decode
+    once in C, so there's no point paying for `res.text()` here."""
+    cache_path = os.path.join(_CACHE_DIR_STR, path + ".gz")
+    if os.path.isfile(cache_path):
+        with gzip.open(cache_path, "rb") as fp:
+            return fp.read()
+    # Fall back to uncompressed files written by older versions of this script.
+    legacy_path = os.path.join(_CACHE_DIR_STR, path)
+    if os.path.isfile(legacy_path):
+        with open(legacy_path, "rb") as fp:
+            return fp.read()
+    async with _FETCH_SEM:
+        async with session.get(f"{BASE_URL}/{path}") as res:
+            res.raise_for_status()
+            doc = await res.read()
+    Path(cache_path).parent.mkdir(parents=True, exist_ok=True)
+    with gzip.open(cache_path, "wb") as fp:
+        fp.write(doc)
+    return doc
+
+
+def read_csv_column(path: Path, column: str) -> List[str]:
+    """Read one column of a CSV file, preserving row order."""
+    with open(path, newline="") as fp:
+        return [row[column] for row in csv.DictReader(fp)]
+
+
+_NL_RE = re.compile(r"\s*\n+\s*")
+
+
+def remove_newlines(s: str) -> str:
+    """Collapse a multi-line string into a single line."""
+    return _NL_RE.sub(" ", s).strip()
+
+
+_PARA_SPLIT = re.compile(r"\n{2,}")
+
+
+def _clean_documentation(s: str) -> str:
+    """Normalise scraped documentation text: one line per paragraph, with
+    boilerplate paragraphs removed."""
+    paragraphs = (remove_newlines(p) for p in _PARA_SPLIT.split(s) if p.strip())
+    paragraphs = [p for p in paragraphs if not _DOC_REMOVE_RE.fullmatch(p)]
+    return "\n\n".join(paragraphs)
+
+
+def replace_images_with_alt(tree: lxml.html.HtmlElement):
+    """The reference manual renders inline math as images; swap each `<img>`
+    for its alt text so text extraction doesn't lose the math."""
+    for img in _XPATH_IMAGES(tree):
+        alt = img.get("alt", "")
+        parent = img.getparent()
+        if "<" in alt:
+            # Rare: alt text containing markup needs a real parse.
+            repl = lxml.html.fragment_fromstring(alt, create_parent="span")
+            repl.tail = img.tail
+            parent.replace(img, repl)
+        else:
+            # Common case: splice the alt text into the surrounding text nodes
+            # without spawning a parser per image.
+            text = alt + (img.tail or "")
+            prev = img.getprevious()
+            if prev is not None:
+                prev.tail = (prev.tail or "") + text
+            else:
+                parent.text = (parent.text or "") + text
+            parent.remove(img)
+
+
+def _parse_link_list(doc: bytes) -> Dict[str, str]:
+    soup = BeautifulSoup(doc, "lxml")
+    toc = soup.find("ul", class_="ChildLinks")
+    return {
+        a.text.strip(): a["href"]
+        for a in toc.find_all("a")
+        if a.get("href", "").endswith(".html")
+    }
+
+
+# The index pages are parsed at most once per process; even on a warm HTML
+# cache, re-parsing a multi-hundred-link page per call is noticeable.
+_list_cache: Dict[str, Dict[str, str]] = {}
+
+
+async def _fetch_link_list(session: aiohttp.ClientSession, index: str) -> Dict[str, str]:
+    if index not in _list_cache:
+        _list_cache[index] = _parse_link_list(await fetch_html(session, index))
+    return _list_cache[index]
+
+
+async def fetch_parameter_list(session: aiohttp.ClientSession) -> Dict[str, str]:
+    """Return a mapping from parameter name to its doc page path."""
+    return await _fetch_link_list(session, PARAMETER_INDEX)
+
+
+async def fetch_attribute_list(session: aiohttp.ClientSession) -> Dict[str, str]:
+    """Return a mapping from attribute name to its doc page path."""
+    return await _fetch_link_list(session, ATTRIBUTE_INDEX)
+
+
+def _scrape_page_data(doc: bytes, name: str, path: str, fields) -> dict:
+    tree = lxml.html.fromstring(doc)
+    data = {"name": name, "url": f"{BASE_URL}/{path}"}
+    for key, label in fields:
+        cell = _FIELD_XPATHS[label](tree)
+        if cell:
+            data[key] = remove_newlines(cell[0].text_content()).strip()
+    data["section"] = _XPATH_UP_LINK(tree)[0].text_content().strip()
+    replace_images_with_alt(tree)
+    description = "\n\n".join(p.text_content() for p in _XPATH_DESCRIPTION(tree))
+    data["doc"] = _clean_documentation(description)
+    return data
+
+
+# Parsing a page takes long enough that doing it on the event-loop thread
+# stalls concurrent fetches; farm it out to worker processes instead.  Workers
+# are only spawned on first use, so warm runs that parse nothing pay nothing.
+_PROCESS_POOL = ProcessPoolExecutor(max_workers=os.cpu_count())
+
+
+async def _fetch_page_data(session, name: str, path: str, fields) -> dict:
+    doc = await fetch_html(session, path)
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_PROCESS_POOL, _scrape_page_data, doc, name, path, fields)
+
+
+async def fetch_parameter_data(session: aiohttp.ClientSession, name: str, path: str) -> dict:
+    """Scrape the metadata table and description from a parameter's doc page."""
+    return await _fetch_page_data(session, name, path, PARAMETER_FIELDS)
+
+
+async def fetch_attribute_data(session: aiohttp.ClientSession, name: str, path: str) -> dict:
+    """Scrape the metadata table and description from an attribute's doc page."""
+    return await _fetch_page_data(session, name, path, ATTRIBUTE_FIELDS)